@@ -1,3 +1,4 @@
+import copy
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional, Set, Union
@@ -89,6 +90,32 @@ class ProtoModel(BaseModel):
 
         return cls.parse_raw(path.read_bytes(), encoding=encoding)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'ProtoModel':
+        """Builds a Model object from already validated data, skipping all field validation.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The trusted field values of the Model. Missing fields are filled with their defaults.
+
+        Returns
+        -------
+        Model
+            The requested model, constructed without validation.
+
+        Notes
+        -----
+        No coercion takes place: nested models are not built from dictionaries and NumPy arrays are
+        not checked to be castable to their expected shapes. Callers must pass pre-built and pre-shaped values.
+        """
+        if hasattr(cls, "model_construct"):
+            return cls.model_construct(**data)
+
+        values = {k: copy.deepcopy(v.default) for k, v in cls.__fields__.items() if not v.required}
+        values.update(data)
+        return cls.construct(values, set(data))
+
     def dict(self, **kwargs) -> Dict[str, Any]:
         encoding = kwargs.pop("encoding", None)
 
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 from pydantic import Schema, constr, validator
 
 from .basemodels import ProtoModel
@@ -30,6 +31,10 @@ class ElectronShell(ProtoModel):
 
     @validator('coefficients', whole=True)
     def _check_coefficient_length(cls, v, values):
+        # Do not raise multiple errors
+        if "exponents" not in values:
+            return v
+
         len_exp = len(values["exponents"])
         for row in v:
             if len(row) != len_exp:
@@ -39,7 +44,7 @@ class ElectronShell(ProtoModel):
 
     @validator('coefficients', whole=True)
     def _check_general_contraction_or_fused(cls, v, values):
-        if len(values["angular_momentum"]) > 1:
+        if len(values.get("angular_momentum", [])) > 1:
             if len(values["angular_momentum"]) != len(v):
                 raise ValueError("The length for a fused shell must equal the length of coefficients.")
 
@@ -98,6 +103,10 @@ class ECPPotential(ProtoModel):
 
     @validator('gaussian_exponents', whole=True)
     def _check_gaussian_exponentst_length(cls, v, values):
+        # Do not raise multiple errors
+        if "r_exponents" not in values:
+            return v
+
         len_exp = len(values["r_exponents"])
         if len(v) != len_exp:
             raise ValueError("The length of gaussian_exponents does not match the length of `r` exponents.")
@@ -106,6 +115,10 @@ class ECPPotential(ProtoModel):
 
     @validator('coefficients', whole=True)
     def _check_coefficient_length(cls, v, values):
+        # Do not raise multiple errors
+        if "r_exponents" not in values:
+            return v
+
         len_exp = len(values["r_exponents"])
         for row in v:
             if len(row) != len_exp:
@@ -123,6 +136,16 @@ class BasisCenter(ProtoModel):
     ecp_potentials: Optional[List[ECPPotential]] = Schema(None, description="ECPs for this center.")
 
 
+def _concatenate(arrays, dtype) -> np.ndarray:
+    if len(arrays) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
+
+
+def _offsets(counts) -> np.ndarray:
+    return np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+
+
 class BasisSet(ProtoModel):
     """
     A quantum chemistry basis description.
@@ -161,7 +184,7 @@ class BasisSet(ProtoModel):
             v = nbf
         else:
             if v != nbf:
-                raise ValidationError("Calculated nbf does not match supplied nbf.")
+                raise ValueError("Calculated nbf does not match supplied nbf.")
 
         return v
 
@@ -185,3 +208,95 @@ class BasisSet(ProtoModel):
             ret += center_count[center]
 
         return ret
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'BasisSet':
+        """
+        Builds a BasisSet from already validated data, skipping all field validation.
+        Unlike :meth:`ProtoModel.from_trusted`, nested center, shell, and ECP dictionaries are converted to
+        their models (also without validation) and a missing `nbf` is computed. Exponents and coefficients are
+        stored as given, so they should be nested lists of floats as produced by the validating constructor.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The trusted field values of the BasisSet.
+
+        Returns
+        -------
+        BasisSet
+            The requested basis set, constructed without validation.
+        """
+
+        center_data = {}
+        for k, center in data["center_data"].items():
+            if isinstance(center, dict):
+                center = center.copy()
+                center["electron_shells"] = [
+                    ElectronShell.from_trusted(x) if isinstance(x, dict) else x for x in center["electron_shells"]
+                ]
+                if center.get("ecp_potentials", None) is not None:
+                    center["ecp_potentials"] = [
+                        ECPPotential.from_trusted(x) if isinstance(x, dict) else x for x in center["ecp_potentials"]
+                    ]
+                center = BasisCenter.from_trusted(center)
+            center_data[k] = center
+
+        data = {**data, "center_data": center_data}
+        if data.get("nbf", None) is None:
+            data["nbf"] = cls._calculate_nbf(data["atom_map"], center_data)
+
+        return super().from_trusted(data)
+
+    def as_soa(self) -> Dict[str, np.ndarray]:
+        """
+        Flattens the electronic shells of every atom in `atom_map` into contiguous arrays (a structure of arrays).
+        Shell ``i`` owns ``exponents[shell_offsets[i]:shell_offsets[i + 1]]`` and likewise for the
+        ``coefficients``/``coefficient_offsets`` and ``am``/``am_offsets`` pairs.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The ``exponents`` and row-major ``coefficients`` of all shells as float64 arrays, the angular momenta
+            ``am``, the ``shell_offsets``, ``coefficient_offsets``, and ``am_offsets`` index arrays, the ``center``
+            index of each shell, and a ``spherical`` mask of the shell harmonic types.
+        """
+
+        shells = [(i, shell) for i, center in enumerate(self.atom_map)
+                  for shell in self.center_data[center].electron_shells]
+
+        exponents = [np.asarray(s.exponents, dtype=np.float64) for _, s in shells]
+        coefficients = [np.asarray(s.coefficients, dtype=np.float64).ravel() for _, s in shells]
+        am = [np.asarray(s.angular_momentum, dtype=np.int64) for _, s in shells]
+
+        return {
+            "exponents": _concatenate(exponents, np.float64),
+            "coefficients": _concatenate(coefficients, np.float64),
+            "am": _concatenate(am, np.int64),
+            "shell_offsets": _offsets([x.size for x in exponents]),
+            "coefficient_offsets": _offsets([x.size for x in coefficients]),
+            "am_offsets": _offsets([x.size for x in am]),
+            "center": np.array([i for i, _ in shells], dtype=np.int64),
+            "spherical": np.array([s.harmonic_type == "spherical" for _, s in shells], dtype=bool),
+        }
+
+    def contracted_mask(self) -> np.ndarray:
+        """
+        Checks which shells of every atom in `atom_map` are contracted, see :meth:`ElectronShell.is_contracted`.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array over the shells, ordered as in :meth:`as_soa`.
+        """
+
+        # Each center is checked once, atoms sharing a center reuse its mask
+        masks = {
+            label: np.array([shell.is_contracted() for shell in center.electron_shells], dtype=bool)
+            for label, center in self.center_data.items()
+        }
+
+        if not self.atom_map:
+            return np.zeros(0, dtype=bool)
+
+        return np.concatenate([masks[label] for label in self.atom_map])
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Any, Dict, Optional
+from weakref import WeakValueDictionary
 
 import numpy as np
 from pydantic import Schema
@@ -10,6 +11,11 @@ from .basemodels import ProtoModel
 ndarray_encoder = {np.ndarray: lambda v: v.flatten().tolist()}
 
 
+# Interned Provenance objects, see Provenance.get_or_create
+_PROV_FIELDS = {"creator", "version", "routine"}
+_PROV_CACHE: WeakValueDictionary = WeakValueDictionary()
+
+
 class Provenance(ProtoModel):
     """
     Provenance information.
@@ -22,6 +28,49 @@ class Provenance(ProtoModel):
         canonical_repr = True
         extra = "allow"
 
+    def __hash__(self) -> int:
+        return hash((self.creator, self.version, self.routine))
+
+    @classmethod
+    def get_or_create(cls, **kwargs) -> 'Provenance':
+        """
+        Returns a shared Provenance object for the given fields, only creating one if no live instance exists.
+
+        Parameters
+        ----------
+        **kwargs
+            The Provenance fields. Provenances with extra fields are never shared.
+
+        Returns
+        -------
+        Provenance
+            The interned Provenance object.
+        """
+        if kwargs.keys() - _PROV_FIELDS:
+            return cls(**kwargs)
+
+        prov = _PROV_CACHE.get((kwargs.get("creator"), kwargs.get("version"), kwargs.get("routine")))
+        if prov is None:
+            prov = cls._intern(cls(**kwargs))
+
+        return prov
+
+    @classmethod
+    def _intern(cls, prov: 'Provenance') -> 'Provenance':
+        """Returns the live Provenance equal to the validated `prov`, registering `prov` itself if there is none."""
+
+        # Extra fields are not part of the key, never share these
+        if prov.__dict__.keys() - _PROV_FIELDS:
+            return prov
+
+        key = (prov.creator, prov.version, prov.routine)
+        cached = _PROV_CACHE.get(key)
+        if cached is None:
+            _PROV_CACHE[key] = prov
+            return prov
+
+        return cached
+
 
 class Model(ProtoModel):
     """
@@ -41,6 +90,17 @@ class Model(ProtoModel):
         extra = "allow"
 
 
+_DERIV_INT = {
+    'energy': 0,
+    'gradient': 1,
+    'hessian': 2,
+    'third': 3,
+    'fourth': 4,
+    'fifth': 5,
+    'properties': 0,
+}
+
+
 class DriverEnum(str, Enum):
     """Allowed quantum chemistry driver values.
     """
@@ -50,11 +110,7 @@ class DriverEnum(str, Enum):
     properties = 'properties'
 
     def derivative_int(self):
-        egh = ['energy', 'gradient', 'hessian', 'third', 'fourth', 'fifth']
-        if self == 'properties':
-            return 0
-        else:
-            return egh.index(self)
+        return _DERIV_INT[self.value]
 
 
 class ComputeError(ProtoModel):
@@ -171,7 +171,7 @@ class WavefunctionProperties(ProtoModel):
             return v
 
         try:
-            v = v.reshape(bas.nbf, -1)
+            v = np.ascontiguousarray(v).reshape(bas.nbf, -1)
         except (ValueError, AttributeError):
             raise ValueError("Matrix must be castable to shape (nbf, -1)!")
         return v
@@ -196,7 +196,7 @@ class WavefunctionProperties(ProtoModel):
             return v
 
         try:
-            v = v.reshape(bas.nbf, bas.nbf)
+            v = np.ascontiguousarray(v).reshape(bas.nbf, bas.nbf)
         except (ValueError, AttributeError):
             raise ValueError("Matrix must be castable to shape (nbf, nbf)!")
         return v
@@ -292,6 +292,10 @@ class Result(ResultInput):
         raise ValueError("Only {0} or {1} is allowed for schema_name, "
                          "which will be converted to {0}".format(qcschema_output_default, qcschema_input_default))
 
+    @validator("provenance", whole=True)
+    def _intern_provenance(cls, v):
+        return Provenance._intern(v)
+
     @validator("return_result", whole=True)
     def _validate_return_result(cls, v, values):
         if values["driver"] == "gradient":
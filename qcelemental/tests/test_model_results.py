@@ -71,7 +71,7 @@ center_data = {
     }
 } # yapf: disable
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def result_data_fixture():
     mol = qcel.models.Molecule.from_data("""
         O 0 0 0
@@ -94,33 +94,32 @@ def result_data_fixture():
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def wavefunction_data_fixture(result_data_fixture):
     bas = basis.BasisSet(name="custom_basis",
                          center_data=center_data,
                          atom_map=["bs_sto3g_o", "bs_sto3g_h", "bs_sto3g_h"])
-    c_matrix = np.random.rand(bas.nbf, bas.nbf)
-    result_data_fixture["protocols"] = {"wavefunction": "all"}
-    result_data_fixture["wavefunction"] = {
+    c_matrix = np.random.default_rng(0).random((bas.nbf, bas.nbf))
+
+    ret = result_data_fixture.copy()
+    ret["protocols"] = {"wavefunction": "all"}
+    ret["wavefunction"] = {
         "basis": bas,
         "restricted": True,
         "scf_orbitals_a": c_matrix,
         "orbitals_a": "scf_orbitals_a"
     }
 
-    return result_data_fixture
+    return ret
 
 
 @pytest.fixture(scope="function")
 def optimization_data_fixture(result_data_fixture):
 
-    trajectory = []
-    energies = []
-    for x in range(5):
-        result = result_data_fixture.copy()
-        result["return_result"] = x
-        trajectory.append(result)
-        energies.append(x)
+    # Frames share every field but `return_result` with the validated base, which is safe as models are immutable
+    base = qcel.models.Result(**result_data_fixture)
+    trajectory = [base.copy(update={"return_result": x}) for x in range(5)]
+    energies = list(range(5))
 
     ret = {
         "initial_molecule": result_data_fixture["molecule"],
@@ -160,6 +159,64 @@ def test_basis_set_build():
     assert es[1].is_contracted() is False
     assert es[2].is_contracted()
 
+    shells = [shell for center in bas.atom_map for shell in bas.center_data[center].electron_shells]
+    assert bas.contracted_mask().tolist() == [shell.is_contracted() for shell in shells]
+
+
+def test_basis_set_contracted_mask_empty_shell():
+    shell = {"angular_momentum": [0], "harmonic_type": "spherical", "exponents": [], "coefficients": [[]]}
+    bas = basis.BasisSet(name="custom_basis",
+                         center_data={"empty": {"electron_shells": [shell]}},
+                         atom_map=["empty", "empty"])
+
+    assert bas.center_data["empty"].electron_shells[0].is_contracted() is False
+    assert bas.contracted_mask().tolist() == [False, False]
+
+
+@pytest.mark.parametrize("encoding", ["json", "json-ext"])
+def test_basis_set_serialization(encoding):
+    bas = basis.BasisSet(name="custom_basis", center_data=center_data, atom_map=["bs_sto3g_o", "bs_def2tzvp_zr"])
+
+    bas2 = basis.BasisSet.parse_raw(bas.serialize(encoding), encoding=encoding)
+    assert np.shape(bas2.center_data["bs_sto3g_o"].electron_shells[1].coefficients) == (2, 3)
+    assert bas.compare(bas2)
+
+
+def test_basis_set_schema():
+    schema = basis.BasisSet.schema()
+    assert schema["title"] == "BasisSet"
+
+    shell = basis.ElectronShell.schema()
+    assert shell["properties"]["exponents"]["type"] == "array"
+    assert shell["properties"]["coefficients"]["items"]["type"] == "array"
+
+
+def test_basis_set_from_trusted():
+    atom_map = ["bs_sto3g_o", "bs_sto3g_h", "bs_sto3g_h", "bs_def2tzvp_zr"]
+    bas = basis.BasisSet(name="custom_basis", center_data=center_data, atom_map=atom_map)
+    trusted = basis.BasisSet.from_trusted({"name": "custom_basis", "center_data": center_data, "atom_map": atom_map})
+
+    assert trusted.nbf == 21
+    assert isinstance(trusted.center_data["bs_def2tzvp_zr"].ecp_potentials[0], basis.ECPPotential)
+    assert trusted.contracted_mask().tolist() == bas.contracted_mask().tolist()
+    assert bas.compare(trusted)
+
+
+def test_basis_set_soa():
+    bas = basis.BasisSet(name="custom_basis",
+                         center_data=center_data,
+                         atom_map=["bs_sto3g_o", "bs_sto3g_h", "bs_sto3g_h", "bs_def2tzvp_zr"])
+
+    soa = bas.as_soa()
+    assert soa["shell_offsets"].tolist() == [0, 3, 6, 9, 12, 15, 19, 22, 23]
+    assert soa["am_offsets"].tolist() == [0, 1, 3, 4, 5, 6, 7, 8, 9]
+    assert soa["center"].tolist() == [0, 0, 0, 1, 2, 3, 3, 3]
+    assert soa["exponents"].size == soa["shell_offsets"][-1]
+    assert soa["coefficients"].size == soa["coefficient_offsets"][-1]
+
+    shell = bas.center_data["bs_sto3g_o"].electron_shells[1]
+    assert np.allclose(soa["coefficients"][3:9].reshape(2, 3), shell.coefficients)
+
 
 def test_basis_electron_center_raises():
     data = center_data["bs_sto3g_h"]["electron_shells"][0].copy()
@@ -180,6 +237,28 @@ def test_basis_electron_center_raises():
 
     assert "fused shell" in str(e.value)
 
+    # Check flat coefficients and nested exponents
+    bad_flat = data.copy()
+    bad_flat["coefficients"] = [0.1, 0.2, 0.3]
+    with pytest.raises(ValueError):
+        basis.ElectronShell(**bad_flat)
+
+    bad_exp = data.copy()
+    bad_exp["exponents"] = [[1.0, 2.0], [3.0, 4.0]]
+    with pytest.raises(ValueError):
+        basis.ElectronShell(**bad_exp)
+
+    # Check missing values
+    none_exp = data.copy()
+    none_exp["exponents"] = [None] + data["exponents"][1:]
+    with pytest.raises(ValueError):
+        basis.ElectronShell(**none_exp)
+
+    none_coef = data.copy()
+    none_coef["coefficients"] = [[None] + data["coefficients"][0][1:]]
+    with pytest.raises(ValueError):
+        basis.ElectronShell(**none_coef)
+
 
 def test_basis_ecp_center_raises():
     # Check coefficients
@@ -203,14 +282,45 @@ def test_basis_map_raises():
         assert basis.BasisSet(name="custom_basis", center_data=center_data, atom_map=["something_odd"])
 
 
+def test_basis_nbf_raises():
+
+    with pytest.raises(ValueError) as e:
+        basis.BasisSet(name="custom_basis", center_data=center_data, atom_map=["bs_sto3g_h"], nbf=5)
+
+    assert "does not match supplied nbf" in str(e.value)
+
+
 def test_result_build(result_data_fixture):
     ret = qcel.models.Result(**result_data_fixture)
     assert ret.wavefunction is None
 
 
+def test_result_provenance_interned(result_data_fixture):
+    ret1 = qcel.models.Result(**result_data_fixture)
+    ret2 = qcel.models.Result(**result_data_fixture)
+    assert ret1.provenance is ret2.provenance
+
+    assert qcel.models.Provenance.get_or_create(creator="qcel") is ret1.provenance
+
+    extra = qcel.models.Provenance.get_or_create(creator="qcel", hostname="node1")
+    assert extra is not ret1.provenance
+    assert extra.hostname == "node1"
+
+    ret3 = qcel.models.Result(**{**result_data_fixture, "provenance": extra})
+    assert ret3.provenance.hostname == "node1"
+
+
+def test_result_from_trusted(result_data_fixture):
+    ret = qcel.models.Result.from_trusted(result_data_fixture)
+    assert ret.return_result == 5
+    assert ret.wavefunction is None
+    assert ret.keywords == {}
+
+
 def test_result_build_wavefunction_delete(wavefunction_data_fixture):
-    del wavefunction_data_fixture["protocols"]
-    ret = qcel.models.Result(**wavefunction_data_fixture)
+    data = wavefunction_data_fixture.copy()
+    del data["protocols"]
+    ret = qcel.models.Result(**data)
     assert ret.wavefunction is None
 
 
@@ -218,62 +328,99 @@ def test_wavefunction_build(wavefunction_data_fixture):
     assert qcel.models.Result(**wavefunction_data_fixture)
 
 
+def test_wavefunction_matrix_contiguous(wavefunction_data_fixture):
+    data = wavefunction_data_fixture.copy()
+    data["wavefunction"] = data["wavefunction"].copy()
+    orbitals = np.asfortranarray(data["wavefunction"]["scf_orbitals_a"])
+    data["wavefunction"]["scf_orbitals_a"] = orbitals
+    assert not orbitals.flags.c_contiguous
+
+    wfn = qcel.models.Result(**data)
+    assert wfn.wavefunction.scf_orbitals_a.flags.c_contiguous
+    assert np.array_equal(wfn.wavefunction.scf_orbitals_a, orbitals)
+
+
 def test_wavefunction_matrix_size_error(wavefunction_data_fixture):
 
-    wavefunction_data_fixture["wavefunction"]["scf_orbitals_a"] = np.random.rand(2, 2)
+    data = wavefunction_data_fixture.copy()
+    data["wavefunction"] = data["wavefunction"].copy()
+    data["wavefunction"]["scf_orbitals_a"] = np.random.rand(2, 2)
     with pytest.raises(ValueError) as e:
-        qcel.models.Result(**wavefunction_data_fixture)
+        qcel.models.Result(**data)
 
     assert "castable to shape" in str(e.value)
 
 
 def test_wavefunction_return_result_pointer(wavefunction_data_fixture):
 
-    del wavefunction_data_fixture["wavefunction"]["scf_orbitals_a"]
+    data = wavefunction_data_fixture.copy()
+    data["wavefunction"] = data["wavefunction"].copy()
+    del data["wavefunction"]["scf_orbitals_a"]
     with pytest.raises(ValueError) as e:
-        qcel.models.Result(**wavefunction_data_fixture)
+        qcel.models.Result(**data)
 
     assert "does not exist" in str(e.value)
 
 
-@pytest.mark.parametrize("protocol, restricted, provided, expected", [
-    ('none', True, ['orbitals_a', 'orbitals_b'], []),
-    (None, True, ['orbitals_a', 'orbitals_b'], []),
-    ('all', False, ['orbitals_a', 'orbitals_b'], ['orbitals_a', 'orbitals_b']),
-    ('all', True, ['orbitals_a', 'orbitals_b'], ['orbitals_a']),
-    ('orbitals_and_eigenvalues', False, ['orbitals_a', 'orbitals_b', 'fock_a', 'fock_b'], ['orbitals_a', 'orbitals_b'
-                                                                                           ]),
-    ('orbitals_and_eigenvalues', True, ['orbitals_a', 'orbitals_b', 'eigenvalues_a', 'fock_a', 'fock_b'
-                                        ], ['orbitals_a', 'eigenvalues_a']),
-    ('return_results', True, ['orbitals_a', 'fock_a', 'fock_b'], ['orbitals_a', 'fock_a']),
-])
-def test_wavefunction_protocols(protocol, restricted, provided, expected, wavefunction_data_fixture):
+wavefunction_protocol_cases = [
+    ('none', True, ['orbitals_a', 'orbitals_b'], frozenset()),
+    (None, True, ['orbitals_a', 'orbitals_b'], frozenset()),
+    ('all', False, ['orbitals_a', 'orbitals_b'],
+     frozenset({'orbitals_a', 'scf_orbitals_a', 'orbitals_b', 'scf_orbitals_b', 'basis', 'restricted'})),
+    ('all', True, ['orbitals_a', 'orbitals_b'], frozenset({'orbitals_a', 'scf_orbitals_a', 'basis', 'restricted'})),
+    ('orbitals_and_eigenvalues', False, ['orbitals_a', 'orbitals_b', 'fock_a', 'fock_b'],
+     frozenset({'orbitals_a', 'scf_orbitals_a', 'orbitals_b', 'scf_orbitals_b', 'basis', 'restricted'})),
+    ('orbitals_and_eigenvalues', True, ['orbitals_a', 'orbitals_b', 'eigenvalues_a', 'fock_a', 'fock_b'],
+     frozenset({'orbitals_a', 'scf_orbitals_a', 'eigenvalues_a', 'scf_eigenvalues_a', 'basis', 'restricted'})),
+    ('return_results', True, ['orbitals_a', 'fock_a', 'fock_b'],
+     frozenset({'orbitals_a', 'scf_orbitals_a', 'fock_a', 'scf_fock_a', 'basis', 'restricted'})),
+]
+
+
+@pytest.fixture(scope="module")
+def wavefunction_arrays_fixture(wavefunction_data_fixture):
+    nbf = wavefunction_data_fixture["wavefunction"]["basis"].nbf
+    rng = np.random.default_rng(0)
 
-    wfn_data = wavefunction_data_fixture["wavefunction"]
+    return rng.random((nbf, nbf)), rng.random(nbf)
+
+
+@pytest.fixture(scope="module", params=wavefunction_protocol_cases)
+def wavefunction_protocol_fixture(request, wavefunction_data_fixture, wavefunction_arrays_fixture):
+    protocol, restricted, provided, expected_keys = request.param
+    matrix, vector = wavefunction_arrays_fixture
+
+    data = wavefunction_data_fixture.copy()
+    wfn_data = data["wavefunction"] = data["wavefunction"].copy()
 
     if protocol is None:
-        wavefunction_data_fixture.pop("protocols")
+        data.pop("protocols")
     else:
-        wavefunction_data_fixture["protocols"]["wavefunction"] = protocol
+        data["protocols"] = {"wavefunction": protocol}
 
     wfn_data["restricted"] = restricted
-    bas = wfn_data["basis"]
 
+    # All cases share the same arrays, the models only ever take views of them
     for name in provided:
         scf_name = "scf_" + name
         wfn_data[name] = scf_name
         if "eigen" in name:
-            wfn_data[scf_name] = np.random.rand(bas.nbf)
+            wfn_data[scf_name] = vector
         else:
-            wfn_data[scf_name] = np.random.rand(bas.nbf, bas.nbf)
+            wfn_data[scf_name] = matrix
+
+    return protocol, restricted, provided, expected_keys, data
 
-    wfn = qcel.models.Result(**wavefunction_data_fixture)
 
-    if len(expected) == 0:
+def test_wavefunction_protocols(wavefunction_protocol_fixture):
+    protocol, restricted, provided, expected_keys, data = wavefunction_protocol_fixture
+
+    wfn = qcel.models.Result(**data)
+
+    if len(expected_keys) == 0:
         assert wfn.wavefunction is None
     else:
-        expected_keys = (set(expected) | {"scf_" + x for x in expected} | {"basis", "restricted"})
-        assert wfn.wavefunction.dict().keys() == expected_keys
+        assert frozenset(wfn.wavefunction.dict().keys()) == expected_keys
 
 
 @pytest.mark.parametrize("keep, indices", [
@@ -291,4 +438,20 @@ def test_optimization_trajectory_protocol(keep, indices, optimization_data_fixtu
 
     assert len(opt.trajectory) == len(indices)
     for result, index in zip(opt.trajectory, indices):
-        assert result.return_result == index
\ No newline at end of file
+        assert result.return_result == index
+
+
+def test_provenance_hash():
+    prov = qcel.models.Provenance(creator="qcel", version="v1")
+    assert hash(prov) == hash(qcel.models.Provenance(creator="qcel", version="v1"))
+    assert len({prov, qcel.models.Provenance(creator="qcel", version="v1"), qcel.models.Provenance(creator="x")}) == 2
+
+
+@pytest.mark.parametrize("driver, dint", [
+    ("energy", 0),
+    ("gradient", 1),
+    ("hessian", 2),
+    ("properties", 0),
+])
+def test_driver_derivative_int(driver, dint):
+    assert qcel.models.common_models.DriverEnum(driver).derivative_int() == dint
@@ -1,3 +1,4 @@
+import json
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -6,6 +7,7 @@ from pydantic import BaseModel, Schema
 
 import qcelemental as qcel
 from qcelemental.testing import compare_recursive, compare_values
+from qcelemental.util.serialization import JSONArrayEncoder
 
 from .addons import serialize_extensions
 
@@ -254,3 +256,44 @@ def test_auto_gen_doc_delete(doc_fixture):
 def test_serialization(obj, encoding):
     new_obj = qcel.util.deserialize(qcel.util.serialize(obj, encoding=encoding), encoding=encoding)
     assert compare_recursive(obj, new_obj)
+
+
+def test_json_dumps_flattens_arrays():
+    arr = np.arange(6, dtype=np.float64).reshape(2, 3)
+    blob = qcel.util.json_dumps({"a": arr, "b": arr.T})
+    assert json.loads(blob) == {"a": [0, 1, 2, 3, 4, 5], "b": [0, 3, 1, 4, 2, 5]}
+
+    # Arrays inside nested models are flattened as well
+    mol = qcel.models.Molecule(symbols=["He", "He"], geometry=[0, 0, 0, 0, 0, 2])
+    blob = qcel.util.json_dumps({"m": mol})
+    assert json.loads(blob)["m"]["geometry"] == [0, 0, 0, 0, 0, 2]
+
+
+@pytest.mark.parametrize("obj", [
+    {"a": float("nan"), "b": 1.0},
+    {"a": np.array([1.0, np.inf])},
+    {"a": 2**70},
+])
+def test_json_dumps_stdlib_fallback(obj):
+    assert qcel.util.json_dumps(obj) == json.dumps(obj, cls=JSONArrayEncoder)
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+def test_json_dumps_float_precision(dtype):
+    obj = {"a": np.array([[0.1, 0.00001]], dtype=dtype)}
+    assert json.loads(qcel.util.json_dumps(obj)) == json.loads(json.dumps(obj, cls=JSONArrayEncoder))
+
+
+def test_json_nan_roundtrip():
+    mol = qcel.models.Molecule(symbols=["He"], geometry=[0, 0, 0])
+    res = qcel.models.Result(molecule=mol,
+                             driver="energy",
+                             model={"method": "UFF"},
+                             return_result=float("nan"),
+                             success=True,
+                             properties={"scf_total_energy": float("nan")},
+                             provenance={"creator": "qcel"})
+
+    res2 = qcel.models.Result.parse_raw(res.serialize("json"))
+    assert np.isnan(res2.properties.scf_total_energy)
+    assert np.isnan(res2.return_result)
@@ -1,4 +1,5 @@
 import json
+import math
 from typing import Any, Union
 
 import numpy as np
@@ -11,6 +12,11 @@ try:
 except ModuleNotFoundError:
     pass
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    pass
+
 _msgpack_which_msg = "Please install via `conda install msgpack-python`."
 
 ## MSGPackExt
@@ -203,8 +209,52 @@ class JSONArrayEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+class _NonFiniteError(ValueError):
+    """Raised when data holds NaN or infinity, which orjson would silently write as null."""
+
+
+def _orjson_default(obj: Any) -> Any:
+    try:
+        return _ravel_arrays(pydantic_encoder(obj))
+    except TypeError:
+        pass
+
+    # Only reached for arrays orjson cannot write natively (e.g., string or object dtypes, 0-d arrays)
+    if isinstance(obj, np.ndarray):
+        if obj.shape:
+            return obj.ravel().tolist()
+        else:
+            return obj.tolist()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _ravel_arrays(data: Any) -> Any:
+    """Flattens all multi-dimensional arrays so that orjson writes them as flat JSON lists.
+    Float arrays of other precisions are cast to float64 so that orjson writes the same values as ``tolist``.
+    Raises _NonFiniteError for non-finite floats so that the caller can fall back to the stdlib encoder."""
+
+    if isinstance(data, dict):
+        return {k: _ravel_arrays(v) for k, v in data.items()}
+    elif isinstance(data, (list, tuple)):
+        return [_ravel_arrays(v) for v in data]
+    elif isinstance(data, np.ndarray):
+        if data.dtype.kind in "fc" and not np.isfinite(data).all():
+            raise _NonFiniteError
+        if data.dtype.kind == "f" and data.dtype != np.float64:
+            data = data.astype(np.float64)
+        return data.ravel() if data.ndim > 1 else data
+    elif isinstance(data, float) and not math.isfinite(data):
+        raise _NonFiniteError
+    else:
+        return data
+
+
 def json_dumps(data: Any) -> str:
     """Safe serialization of a Python dictionary to JSON string representation using all known encoders.
+    If orjson is available, NumPy arrays are written directly from their buffers rather than converted to lists.
+    The values written are the same as with the stdlib encoder, but the number formatting may differ (e.g., ``1e-05``
+    is written as ``0.00001``).
 
     Parameters
     ----------
@@ -217,6 +267,15 @@ def json_dumps(data: Any) -> str:
         A JSON representation of the data.
     """
 
+    if which_import("orjson", return_bool=True):
+        # orjson cannot write NaN/Infinity or integers wider than 64 bits, those use the stdlib encoder
+        try:
+            return orjson.dumps(_ravel_arrays(data),
+                                default=_orjson_default,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+        except (orjson.JSONEncodeError, _NonFiniteError):
+            pass
+
     return json.dumps(data, cls=JSONArrayEncoder)
 
 